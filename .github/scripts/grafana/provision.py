@@ -14,19 +14,47 @@ import sys
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("requests library not found.")
     print("Install dependencies with: uv sync")
     print("Or run directly with: uv run python provision.py")
     sys.exit(1)
 
+# orjson is optional; it parses large dashboards considerably faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 GRAFANA_URL = os.getenv("GRAFANA_URL", "").rstrip("/")
 GRAFANA_TOKEN = os.getenv("GRAFANA_SERVICE_ACCOUNT_TOKEN", "")
 
 
+def create_session() -> requests.Session:
+    """Create a pooled HTTP session that retries transient server errors."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504]),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared session so connections are kept alive across API calls
+SESSION = create_session()
+
+
 def load_dashboard_json(file_path: str) -> dict:
     """Load dashboard JSON from file."""
     try:
+        if orjson is not None:
+            with open(file_path, 'rb') as f:
+                return orjson.loads(f.read())
         with open(file_path, 'r') as f:
             return json.load(f)
     except Exception as e:
@@ -37,7 +65,7 @@ def load_dashboard_json(file_path: str) -> dict:
 def find_prometheus_datasource_uid(grafana_url: str, token: str) -> str:
     """Find the UID of the Prometheus datasource (excluding usage datasource)."""
     try:
-        response = requests.get(
+        response = SESSION.get(
             f"{grafana_url}/api/datasources",
             headers={"Authorization": f"Bearer {token}"},
             timeout=10
@@ -52,30 +80,31 @@ def find_prometheus_datasource_uid(grafana_url: str, token: str) -> str:
 
         # Look for Prometheus or Mimir datasource, but exclude usage datasource
         # Prefer datasources with "prom" in the name (user's metrics), not "usage" (billing metrics)
-        prom_datasources = []
+        fallback = None
         for ds in datasources:
-            if ds.get("type") in ["prometheus", "prometheus-mimir"]:
-                name = ds.get("name", "")
-                uid = ds.get("uid")
+            if ds.get("type") not in ("prometheus", "prometheus-mimir"):
+                continue
 
-                # Skip usage/billing datasources
-                if "usage" in name.lower():
-                    print(f"Skipping usage datasource: {name}")
-                    continue
+            name = ds.get("name", "")
+            lower_name = name.lower()
 
-                prom_datasources.append({"name": name, "uid": uid})
+            # Skip usage/billing datasources
+            if "usage" in lower_name:
+                print(f"Skipping usage datasource: {name}")
+                continue
 
-        # Prefer datasource with "prom" in name
-        for ds in prom_datasources:
-            if "prom" in ds["name"].lower():
-                print(f"Found Prometheus datasource: {ds['name']} (UID: {ds['uid']})")
-                return ds["uid"]
+            # Prefer datasource with "prom" in name
+            if "prom" in lower_name:
+                print(f"Found Prometheus datasource: {name} (UID: {ds.get('uid')})")
+                return ds.get("uid")
 
-        # Fallback to first non-usage datasource
-        if prom_datasources:
-            ds = prom_datasources[0]
-            print(f"Found Prometheus datasource: {ds['name']} (UID: {ds['uid']})")
-            return ds["uid"]
+            # Remember the first non-usage datasource as a fallback
+            if fallback is None:
+                fallback = ds
+
+        if fallback is not None:
+            print(f"Found Prometheus datasource: {fallback.get('name', '')} (UID: {fallback.get('uid')})")
+            return fallback.get("uid")
 
         print("No Prometheus datasource found")
         return None
@@ -86,39 +115,39 @@ def find_prometheus_datasource_uid(grafana_url: str, token: str) -> str:
 
 
 def replace_datasource_placeholder(dashboard: dict, datasource_uid: str) -> dict:
-    """Replace ${datasource} placeholder with actual datasource UID."""
-    dashboard_str = json.dumps(dashboard)
-    dashboard_str = dashboard_str.replace("${datasource}", datasource_uid)
-    dashboard_str = dashboard_str.replace('"uid": "prometheus"', f'"uid": "{datasource_uid}"')
-    return json.loads(dashboard_str)
-
-
-def check_dashboard_exists(grafana_url: str, token: str, dashboard_uid: str) -> bool:
-    """Check if dashboard already exists."""
-    try:
-        response = requests.get(
-            f"{grafana_url}/api/dashboards/uid/{dashboard_uid}",
-            headers={"Authorization": f"Bearer {token}"},
-            timeout=10
-        )
-        return response.status_code == 200
-    except Exception:
-        return False
+    """
+    Replace ${datasource} placeholder with actual datasource UID.
+
+    The dashboard is walked and updated in place; the same object is returned.
+    """
+    placeholder = "${datasource}"
+
+    def _walk(node):
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key == "uid" and value == "prometheus":
+                    node[key] = datasource_uid
+                elif isinstance(value, str):
+                    if placeholder in value:
+                        node[key] = value.replace(placeholder, datasource_uid)
+                else:
+                    _walk(value)
+        elif isinstance(node, list):
+            for i, value in enumerate(node):
+                if isinstance(value, str):
+                    if placeholder in value:
+                        node[i] = value.replace(placeholder, datasource_uid)
+                else:
+                    _walk(value)
+
+    _walk(dashboard)
+    return dashboard
 
 
 def provision_dashboard(grafana_url: str, token: str, dashboard_json: dict) -> bool:
     """Provision dashboard via Grafana API (idempotent - creates if not exists, updates if exists)."""
     dashboard_uid = dashboard_json.get("uid", "test-flakiness")
 
-    # Check if dashboard already exists
-    print(f"Checking if dashboard exists (UID: {dashboard_uid})...")
-    exists = check_dashboard_exists(grafana_url, token, dashboard_uid)
-
-    if exists:
-        print("   Dashboard already exists")
-    else:
-        print("   Dashboard does not exist")
-
     # Wrap dashboard in the required format
     payload = {
         "dashboard": dashboard_json,
@@ -127,10 +156,11 @@ def provision_dashboard(grafana_url: str, token: str, dashboard_json: dict) -> b
     }
 
     try:
-        action = "Updating" if exists else "Creating"
-        print(f"{action} dashboard...")
+        # The POST with overwrite=True is an upsert, so there is no need to
+        # probe for an existing dashboard first.
+        print(f"Upserting dashboard (UID: {dashboard_uid})...")
 
-        response = requests.post(
+        response = SESSION.post(
             f"{grafana_url}/api/dashboards/db",
             headers={
                 "Authorization": f"Bearer {token}",
@@ -16,13 +16,21 @@ Environment variables:
   GITHUB_ACTOR: User who triggered the workflow
 """
 
+import argparse
+import math
 import os
+import re
 import sys
 import time
-from typing import Dict, List
+import zlib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, NamedTuple, Optional
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("ERROR: requests library not found.")
     print("Install dependencies with: uv sync")
@@ -44,9 +52,50 @@ GIT_SHA = os.getenv("GITHUB_SHA", "unknown")
 GIT_BRANCH = os.getenv("GITHUB_REF", "unknown")
 GIT_ACTOR = os.getenv("GITHUB_ACTOR", "unknown")
 
+# Max parallel GitHub API requests; kept low to avoid secondary rate limits
+DEFAULT_CONCURRENCY = 8
 
-def fetch_workflow_jobs() -> List[Dict]:
-    """Fetch all jobs from the workflow run using GitHub API with pagination."""
+# Matches matrix test job names and captures the test name
+_TEST_JOB_RE = re.compile(r" / Test (.*)")
+
+# Max lines per InfluxDB write request
+INFLUX_BATCH_SIZE = 5000
+
+# Escape spaces, commas, and equals signs in tag values in a single pass
+_INFLUX_ESCAPE = str.maketrans({" ": "\\ ", ",": "\\,", "=": "\\="})
+
+
+class TestResult(NamedTuple):
+    """Outcome of a single functional test matrix job."""
+
+    test_name: str
+    status: str
+
+
+def create_session() -> requests.Session:
+    """Create a pooled HTTP session that retries transient server errors."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504]),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared session so connections are kept alive across API calls
+SESSION = create_session()
+
+
+def fetch_workflow_jobs(concurrency: int = DEFAULT_CONCURRENCY) -> List[Dict]:
+    """
+    Fetch all jobs from the workflow run using GitHub API with pagination.
+
+    The first page is fetched synchronously to learn `total_count`; the
+    remaining pages are fetched with up to `concurrency` parallel requests.
+    """
     if not GITHUB_TOKEN:
         print("ERROR: GITHUB_TOKEN not set")
         return []
@@ -63,42 +112,53 @@ def fetch_workflow_jobs() -> List[Dict]:
     print(f"   Repository: {GITHUB_REPOSITORY}")
     print(f"   Run ID: {GITHUB_RUN_ID}")
 
-    all_jobs = []
-    page = 1
     per_page = 100
+    base_url = f"https://api.github.com/repos/{GITHUB_REPOSITORY}/actions/runs/{GITHUB_RUN_ID}/jobs"
+
+    # GitHub credentials are passed per request rather than set on the shared
+    # session, which is also used to talk to Grafana.
+    headers = {
+        "Authorization": f"Bearer {GITHUB_TOKEN}",
+        "Accept": "application/vnd.github.v3+json"
+    }
+
+    def _fetch_page(page: int) -> Dict:
+        response = SESSION.get(
+            base_url,
+            params={"per_page": per_page, "page": page},
+            headers=headers,
+            timeout=30
+        )
 
-    try:
-        while True:
-            url = f"https://api.github.com/repos/{GITHUB_REPOSITORY}/actions/runs/{GITHUB_RUN_ID}/jobs?per_page={per_page}&page={page}"
-
-            response = requests.get(
-                url,
-                headers={
-                    "Authorization": f"Bearer {GITHUB_TOKEN}",
-                    "Accept": "application/vnd.github.v3+json"
-                },
-                timeout=30
+        if response.status_code != 200:
+            raise RuntimeError(
+                f"Failed to fetch jobs page {page}: {response.status_code}\n"
+                f"   Response: {response.text}"
             )
 
-            if response.status_code != 200:
-                print(f"ERROR: Failed to fetch jobs: {response.status_code}")
-                print(f"   Response: {response.text}")
-                return all_jobs
-
-            data = response.json()
-            jobs = data.get("jobs", [])
+        return response.json()
 
-            if not jobs:
-                break
-
-            all_jobs.extend(jobs)
-            print(f"   Fetched page {page}: {len(jobs)} jobs")
-
-            # Check if there are more pages
-            if len(jobs) < per_page:
-                break
+    all_jobs = []
 
-            page += 1
+    try:
+        # The first page tells us how many jobs there are in total, so the
+        # remaining pages can be requested concurrently.
+        data = _fetch_page(1)
+        jobs = data.get("jobs", [])
+        all_jobs.extend(jobs)
+        print(f"   Fetched page 1: {len(jobs)} jobs")
+
+        total_count = data.get("total_count", len(jobs))
+        num_pages = math.ceil(total_count / per_page)
+
+        if num_pages > 1:
+            with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+                pages = range(2, num_pages + 1)
+                # `map` preserves page order, so the job list stays stable.
+                for page, page_data in zip(pages, executor.map(_fetch_page, pages)):
+                    jobs = page_data.get("jobs", [])
+                    all_jobs.extend(jobs)
+                    print(f"   Fetched page {page}: {len(jobs)} jobs")
 
         print(f"SUCCESS: Fetched {len(all_jobs)} total jobs from API")
         return all_jobs
@@ -108,7 +168,7 @@ def fetch_workflow_jobs() -> List[Dict]:
         return all_jobs
 
 
-def extract_test_results(jobs: List[Dict]) -> List[Dict]:
+def extract_test_results(jobs: List[Dict]) -> List[TestResult]:
     """
     Extract test results from matrix jobs.
 
@@ -116,6 +176,8 @@ def extract_test_results(jobs: List[Dict]) -> List[Dict]:
     We extract the test name and status (success/failure) from the job.
     """
     results = []
+    status_counts = Counter()
+    failed_tests = []
 
     for job in jobs:
         job_name = job.get("name", "")
@@ -123,11 +185,12 @@ def extract_test_results(jobs: List[Dict]) -> List[Dict]:
 
         # Only process matrix test jobs (skip lint, discover-tests, etc.)
         # Job names from workflow_call appear as: "functional-tests / Test bridge/bridge_deposit_happy"
-        if " / Test " not in job_name:
+        match = _TEST_JOB_RE.search(job_name)
+        if not match:
             continue
 
         # Extract test name from job name: "functional-tests / Test bridge/bridge_deposit_happy" -> "bridge/bridge_deposit_happy"
-        test_name = job_name.split(" / Test ", 1)[1].strip()
+        test_name = match.group(1).strip()
 
         # Map GitHub conclusion to our status
         if conclusion == "success":
@@ -141,25 +204,23 @@ def extract_test_results(jobs: List[Dict]) -> List[Dict]:
         else:
             status = "unknown"
 
-        results.append({
-            "test_name": test_name,
-            "status": status,
-            "conclusion": conclusion,
-        })
+        results.append(TestResult(test_name, status))
+
+        # Tally the summary while iterating instead of re-scanning results
+        status_counts[status] += 1
+        if status == "failed":
+            failed_tests.append(test_name)
 
     print(f"Extracted {len(results)} test results")
 
     # Show summary
-    passed = sum(1 for r in results if r["status"] == "passed")
-    failed = sum(1 for r in results if r["status"] == "failed")
-    print(f"   Passed: {passed}")
-    print(f"   Failed: {failed}")
+    print(f"   Passed: {status_counts['passed']}")
+    print(f"   Failed: {status_counts['failed']}")
 
-    if failed > 0:
+    if failed_tests:
         print(f"   Failed tests:")
-        for r in results:
-            if r["status"] == "failed":
-                print(f"     - {r['test_name']}")
+        for test_name in failed_tests:
+            print(f"     - {test_name}")
 
     return results
 
@@ -168,47 +229,59 @@ def escape_influx_value(value: str) -> str:
     """Escape special characters for InfluxDB line protocol."""
     if not value:
         return "unknown"
-    # Escape spaces, commas, and equals signs in tag values
-    value = value.replace(" ", "\\ ").replace(",", "\\,").replace("=", "\\=")
-    return value
+    return value.translate(_INFLUX_ESCAPE)
+
 
+# Statuses produced by extract_test_results, escaped once at import time
+_STATUS_ESCAPED = {
+    s: escape_influx_value(s) for s in ("passed", "failed", "cancelled", "skipped", "unknown")
+}
 
-def convert_to_influx_line_protocol(results: List[Dict]) -> str:
+
+def iter_influx_lines(results: List[TestResult], timestamp_ns: Optional[int] = None) -> Iterator[str]:
     """
-    Convert test results to InfluxDB line protocol.
+    Yield test results as InfluxDB line protocol, one newline-terminated line at a time.
 
     Format: measurement,tag1=value1,tag2=value2 field1=value1,field2=value2 timestamp
     Example: test_result,test=bridge_deposit,status=passed count=1i,failures=0i 1704629483000000000
     """
-    if not results:
-        return ""
-
-    timestamp_ns = int(time.time() * 1_000_000_000)
-    lines = []
+    if timestamp_ns is None:
+        timestamp_ns = int(time.time() * 1_000_000_000)
 
     branch = escape_influx_value(GIT_BRANCH.replace("refs/heads/", ""))
     actor = escape_influx_value(GIT_ACTOR)
 
-    for result in results:
-        test_name = escape_influx_value(result["test_name"])
-        status = escape_influx_value(result["status"])
+    # Everything but the test name, status and failure count is the same on every
+    # line, so format the shared segments once up front
+    middle = f",branch={branch},actor={actor} count=1i,failures="
+    suffix = f"i {timestamp_ns}\n"
 
-        # Build tags
-        tags = f"test={test_name},status={status},branch={branch},actor={actor}"
+    for result in results:
+        test_name = escape_influx_value(result.test_name)
+        status = _STATUS_ESCAPED.get(result.status) or escape_influx_value(result.status)
 
-        # Build fields
         failures = 1 if status == "failed" else 0
-        fields = f"count=1i,failures={failures}i"
+        yield f"test_result,test={test_name},status={status}{middle}{failures}{suffix}"
+
 
-        # Combine into line protocol
-        line = f"test_result,{tags} {fields} {timestamp_ns}"
-        lines.append(line)
+def gzip_stream(lines: Iterator[str]) -> Iterator[bytes]:
+    """Gzip-compress lines incrementally, yielding compressed chunks as they are produced."""
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    for line in lines:
+        chunk = compressor.compress(line.encode())
+        if chunk:
+            yield chunk
+    yield compressor.flush()
 
-    return "\n".join(lines)
 
+def send_to_grafana(results: List[TestResult]) -> bool:
+    """
+    Send test results to Grafana Cloud using InfluxDB line protocol.
 
-def send_to_grafana(metrics: str) -> bool:
-    """Send metrics to Grafana Cloud using InfluxDB line protocol."""
+    Results are sent in gzip-compressed batches of at most INFLUX_BATCH_SIZE
+    lines, so each request stays bounded and a transient failure only retries
+    the affected batch.
+    """
     if not INFLUX_URL:
         print("ERROR: GRAFANA_CLOUD_INFLUX_URL not set")
         return False
@@ -221,42 +294,71 @@ def send_to_grafana(metrics: str) -> bool:
         print("ERROR: GRAFANA_CLOUD_API_KEY not set")
         return False
 
-    if not metrics:
+    if not results:
         print("WARNING: No metrics to send")
         return False
 
+    num_batches = math.ceil(len(results) / INFLUX_BATCH_SIZE)
+
     print(f"Sending metrics to Grafana Cloud...")
     print(f"   Endpoint: {INFLUX_URL}")
-    print(f"   Metrics lines: {len(metrics.splitlines())}")
+    print(f"   Metrics lines: {len(results)}")
+    print(f"   Batches: {num_batches}")
+
+    # Writes are idempotent for identical tags and timestamp, so POSTs to the
+    # Influx endpoint are safe to retry. Batches share one timestamp.
+    SESSION.mount(INFLUX_URL, HTTPAdapter(max_retries=Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=["POST"],
+        raise_on_status=False,
+    )))
+    timestamp_ns = int(time.time() * 1_000_000_000)
 
-    try:
-        response = requests.post(
-            INFLUX_URL,
-            auth=(INFLUX_USER, API_KEY),
-            headers={"Content-Type": "text/plain"},
-            data=metrics,
-            timeout=30
-        )
+    for i in range(num_batches):
+        batch = results[i * INFLUX_BATCH_SIZE:(i + 1) * INFLUX_BATCH_SIZE]
+        # The body is materialized per batch so that it can be replayed on retry
+        body = b"".join(gzip_stream(iter_influx_lines(batch, timestamp_ns)))
+
+        try:
+            response = SESSION.post(
+                INFLUX_URL,
+                auth=(INFLUX_USER, API_KEY),
+                headers={"Content-Type": "text/plain", "Content-Encoding": "gzip"},
+                data=body,
+                timeout=30
+            )
 
-        if response.status_code in [200, 204]:
-            print("SUCCESS: Metrics sent successfully!")
-            return True
-        else:
-            print(f"ERROR: Failed to send metrics: {response.status_code}")
-            print(f"   Response: {response.text}")
+            if response.status_code not in [200, 204]:
+                print(f"ERROR: Failed to send batch {i + 1}/{num_batches}: {response.status_code}")
+                print(f"   Response: {response.text}")
+                return False
+
+        except Exception as e:
+            print(f"ERROR: Error sending batch {i + 1}/{num_batches}: {e}")
             return False
 
-    except Exception as e:
-        print(f"ERROR: Error sending metrics: {e}")
-        return False
+    print("SUCCESS: Metrics sent successfully!")
+    return True
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Send test metrics to Grafana Cloud")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help="Max parallel GitHub API requests when fetching job pages"
+    )
+
+    args = parser.parse_args()
+
     print("Test Metrics Collector")
     print("=" * 50)
 
     # Fetch workflow jobs from GitHub API
-    jobs = fetch_workflow_jobs()
+    jobs = fetch_workflow_jobs(args.concurrency)
 
     if not jobs:
         print("WARNING: No jobs found, exiting")
@@ -269,17 +371,9 @@ def main():
         print("WARNING: No test results found, exiting")
         return 0
 
-    # Convert to InfluxDB line protocol
-    print("\nConverting to InfluxDB line protocol...")
-    metrics = convert_to_influx_line_protocol(results)
-
-    if not metrics:
-        print("WARNING: No metrics generated")
-        return 0
-
-    # Send to Grafana Cloud
+    # Stream results to Grafana Cloud as InfluxDB line protocol
     print("\nSending to Grafana Cloud...")
-    success = send_to_grafana(metrics)
+    success = send_to_grafana(results)
 
     if success:
         print("\nSUCCESS: Test metrics collection complete!")
@@ -1,9 +1,12 @@
 """EVM account management with per-instance nonce tracking."""
 
 import threading
+from collections.abc import Callable
+from functools import cache
 
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
+from eth_keys import keys
 
 from .config.constants import (
     DEV_CHAIN_ID,
@@ -13,6 +16,18 @@ from .config.constants import (
 )
 
 
+@cache
+def cached_local_account(private_key: str) -> LocalAccount:
+    """Derive a ``LocalAccount`` from a private key, once per key.
+
+    Key derivation is an elliptic-curve scalar multiplication. The
+    resulting account holds no mutable state, so it is safe to share
+    between ``ManagedAccount`` instances, each of which keeps its own
+    nonce counter.
+    """
+    return Account.from_key(private_key)
+
+
 class ManagedAccount:
     """EVM account with thread-safe nonce management.
 
@@ -23,14 +38,16 @@ class ManagedAccount:
 
     def __init__(self, account: LocalAccount, chain_id: int = DEV_CHAIN_ID):
         self._account = account
+        # ``LocalAccount.sign_transaction`` re-parses the raw key and re-derives
+        # the public key on every call; signing with a prebuilt key object skips that.
+        self._signing_key = keys.PrivateKey(account.key)
         self._chain_id = chain_id
         self._nonce: int = 0
         self._nonce_lock = threading.Lock()
 
     @classmethod
     def from_key(cls, private_key: str, chain_id: int = DEV_CHAIN_ID) -> "ManagedAccount":
-        account = Account.from_key(private_key)
-        return cls(account, chain_id)
+        return cls(cached_local_account(private_key), chain_id)
 
     @property
     def address(self) -> str:
@@ -47,6 +64,19 @@ class ManagedAccount:
             self._nonce += 1
             return nonce
 
+    def reserve_nonces(self, count: int) -> range:
+        """Reserve ``count`` consecutive nonces under a single lock acquisition.
+
+        Pass each reserved nonce explicitly to ``sign_transfer`` /
+        ``sign_transaction`` when signing a batch of transactions.
+        """
+        if count < 0:
+            raise ValueError(f"count must be non-negative, got {count}")
+        with self._nonce_lock:
+            start = self._nonce
+            self._nonce += count
+            return range(start, start + count)
+
     def sync_nonce(self, nonce: int) -> None:
         """Sync the internal nonce counter with chain state."""
         with self._nonce_lock:
@@ -74,8 +104,52 @@ class ManagedAccount:
             "data": b"",
             "chainId": self._chain_id,
         }
-        signed = self._account.sign_transaction(tx)
-        return "0x" + signed.raw_transaction.hex()
+        return self._sign(tx)
+
+    def make_transfer_signer(
+        self,
+        *,
+        to: str,
+        gas_price: int,
+        gas: int = 21000,
+    ) -> Callable[[int, int], str]:
+        """Bind the fixed fields of an ETH transfer and return a signer.
+
+        The returned ``sign(nonce, value)`` callable reuses the bound
+        template, which avoids rebuilding the transaction dict when
+        signing many transfers to the same recipient. Returns raw tx hex.
+        """
+        template = {
+            "gasPrice": gas_price,
+            "gas": gas,
+            "to": to,
+            "data": b"",
+            "chainId": self._chain_id,
+        }
+        sign_tx = self._sign
+
+        def sign(nonce: int, value: int) -> str:
+            return sign_tx({**template, "nonce": nonce, "value": value})
+
+        return sign
+
+    def sign_transfer_batch(
+        self,
+        *,
+        to: str,
+        value: int,
+        gas_price: int,
+        count: int,
+        gas: int = 21000,
+    ) -> list[str]:
+        """Sign ``count`` identical ETH transfers on consecutive nonces.
+
+        The nonces are reserved in one step, so the batch is contiguous
+        even if other threads sign concurrently. Returns raw tx hexes in
+        nonce order, suitable for ``JsonRpcClient.batch_send_raw_transactions``.
+        """
+        sign = self.make_transfer_signer(to=to, gas_price=gas_price, gas=gas)
+        return [sign(nonce, value) for nonce in self.reserve_nonces(count)]
 
     def sign_transaction(
         self,
@@ -100,7 +174,11 @@ class ManagedAccount:
             "data": data,
             "chainId": self._chain_id,
         }
-        signed = self._account.sign_transaction(tx)
+        return self._sign(tx)
+
+    def _sign(self, tx: dict) -> str:
+        """Sign a transaction dict with the cached key. Returns raw tx hex."""
+        signed = Account.sign_transaction(tx, self._signing_key)
         return "0x" + signed.raw_transaction.hex()
 
 
@@ -2,12 +2,14 @@
 Configuration dataclasses for services.
 """
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 
-import toml
+import rtoml
 
+from common.config.serialization import shallow_asdict
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ClientConfig:
     rpc_host: str = field(default="")
     rpc_port: int = field(default=0)
@@ -23,7 +25,7 @@ class ClientConfig:
     db_retry_count: int = field(default=3)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BitcoindConfig:
     rpc_url: str = field(default="http://localhost:8443")
     rpc_user: str = field(default="rpcuser")
@@ -33,12 +35,12 @@ class BitcoindConfig:
     retry_interval: int | None = field(default=None)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ReaderConfig:
     client_poll_dur_ms: int = field(default=200)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WriterConfig:
     write_poll_dur_ms: int = field(default=200)
     reveal_amount: int = field(default=546)  # The dust amount
@@ -48,12 +50,12 @@ class WriterConfig:
     mempool_base_url: str | None = field(default=None)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BroadcasterConfig:
     poll_interval_ms: int = field(default=200)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BtcioConfig:
     # Declared first so the scalar serializes before the sub-tables in TOML.
     l1_reorg_safe_depth: int = field(default=6)
@@ -62,7 +64,7 @@ class BtcioConfig:
     broadcaster: BroadcasterConfig = field(default_factory=BroadcasterConfig)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LoggingConfig:
     service_label: str | None = field(default=None)
     otlp_url: str | None = field(default=None)
@@ -73,14 +75,14 @@ class LoggingConfig:
     metrics_port: int | None = field(default=None)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SequencerConfig:
     ol_block_time_ms: int = field(default=5_000)
     max_txs_per_block: int = field(default=100)
     block_template_ttl_secs: int = field(default=60)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProverConfig:
     """Integrated prover configuration. Maps to Rust ``ProverConfig``."""
 
@@ -88,7 +90,7 @@ class ProverConfig:
     workers: int = field(default=1)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FeeModelConfig:
     """v1 L2 fee-model configuration mirroring ``SequencerFeeModelConfig``.
 
@@ -102,7 +104,7 @@ class FeeModelConfig:
     l1_fee_rate_source: str = field(default="btcio_writer")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EeDaConfig:
     """DA pipeline configuration for alpen-client sequencer.
 
@@ -123,7 +125,7 @@ class EeDaConfig:
             raise ValueError(f"magic_bytes must be exactly 4 bytes, got {len(self.magic_bytes)}")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EpochSealingConfig:
     policy: str = field(default="FixedSlot")
     slots_per_epoch: int | None = field(default=4)
@@ -141,7 +143,7 @@ class EpochSealingConfig:
         return ((slot // self.slots_per_epoch) + 1) * self.slots_per_epoch
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StrataConfig:
     client: ClientConfig = field(default_factory=ClientConfig)
     bitcoind: BitcoindConfig = field(default_factory=BitcoindConfig)
@@ -150,19 +152,19 @@ class StrataConfig:
     prover: ProverConfig | None = field(default=None)
 
     def as_toml_string(self) -> str:
-        d = asdict(self)
+        d = shallow_asdict(self)
         # Remove None values (optional configs)
         d = {k: v for k, v in d.items() if v is not None}
-        return toml.dumps(d)
+        return rtoml.dumps(d, none_value=None)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SequencerRuntimeConfig:
     sequencer: SequencerConfig = field(default_factory=SequencerConfig)
     fee_model: FeeModelConfig = field(default_factory=FeeModelConfig)
     epoch_sealing: EpochSealingConfig | None = field(default=None)
 
     def as_toml_string(self) -> str:
-        d = asdict(self)
+        d = shallow_asdict(self)
         d = {k: v for k, v in d.items() if v is not None}
-        return toml.dumps(d)
+        return rtoml.dumps(d, none_value=None)
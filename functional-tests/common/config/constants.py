@@ -75,6 +75,8 @@ class ServiceType(str, Enum):
     AlpenFullNode = "alpen_fullnode"
     StrataSigner = "strata_signer"
 
-    def __str__(self) -> str:
-        """Allow direct use in f-strings and format operations."""
-        return self.value
+    # Allow direct use in f-strings and format operations. Same as
+    # ``enum.StrEnum`` (3.11+): bind the C-level ``str`` slots instead of
+    # defining Python methods that return ``self.value``.
+    __str__ = str.__str__
+    __format__ = str.__format__
@@ -3,11 +3,16 @@ Rollup consensus parameters dataclasses.
 """
 
 import json
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 
+import orjson
 from bitcoinlib.keys import Key
 
+from common.config.serialization import shallow_asdict
 
+
+@lru_cache(maxsize=256)
 def hex_bytes_repeated(n: int, repeat: int = 32) -> str:
     """Generate hex string of repeated byte value.
 
@@ -23,14 +28,19 @@ def hex_bytes_repeated(n: int, repeat: int = 32) -> str:
     """
     if not 0 <= n < 256:
         raise ValueError(f"Byte value must be in range 0-255, got: {n}")
-    return bytes([n] * repeat).hex()
+    return (bytes((n,)) * repeat).hex()
+
+
+# Default 32-byte all-zero hash. Strings are immutable, so it is shared as a
+# plain field default rather than rebuilt per instance by a factory.
+_ZERO_HEX32 = hex_bytes_repeated(0)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class L1BlockCommitment:
     height: int = field(default=100)
     # TODO(STR-3692): more type safe
-    blkid: str = field(default_factory=lambda: hex_bytes_repeated(0))
+    blkid: str = field(default=_ZERO_HEX32)
 
     @staticmethod
     def at_latest_block(btc_rpc) -> "L1BlockCommitment":
@@ -44,22 +54,22 @@ class L1BlockCommitment:
 def gen_random_keypair() -> tuple[str, Key]:
     """Generates a keypair and returns a tuple of xonly pubkey and privkey."""
     key = Key()
-    xpubkey = format(key.x, "064x")
+    xpubkey = key.x.to_bytes(32, "big").hex()
     return xpubkey, key
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GenesisAccountData:
     """Genesis snark account data. Maps to Rust GenesisSnarkAccountData."""
 
     predicate: str = (
         "Bip340Schnorr:4d4b6cd1361032ca9bd2aeb9d900aa4d45d9ead80ac9423374c451a7254d0766"
     )
-    inner_state: str = field(default_factory=lambda: hex_bytes_repeated(0))
+    inner_state: str = field(default=_ZERO_HEX32)
     balance: int = 0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BridgeParams:
     """Bridge parameters. Maps to Rust BridgeParams."""
 
@@ -68,7 +78,7 @@ class BridgeParams:
     max_withdrawal_descriptor_len: int = 81
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OLParams:
     """OL genesis parameters. Maps to Rust OLParams."""
 
@@ -77,21 +87,24 @@ class OLParams:
     bridge_params: BridgeParams = field(default_factory=BridgeParams)
 
     def with_genesis_l1(self, genesis_l1_block: L1BlockCommitment) -> "OLParams":
-        self.last_l1_block = genesis_l1_block
-        return self
+        return replace(self, last_l1_block=genesis_l1_block)
 
     def as_json_string(self) -> str:
         d = {
-            "accounts": {k: asdict(v) for k, v in self.accounts.items()},
-            "last_l1_block": asdict(self.last_l1_block),
-            "bridge_params": asdict(self.bridge_params),
+            "accounts": {k: shallow_asdict(v) for k, v in self.accounts.items()},
+            "last_l1_block": shallow_asdict(self.last_l1_block),
+            "bridge_params": shallow_asdict(self.bridge_params),
         }
-        return json.dumps(d, indent=2)
+        try:
+            return orjson.dumps(d, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            # orjson rejects integers wider than 64 bits.
+            return json.dumps(d, indent=2)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DepositTxParams:
-    magic_bytes: list[int] = field(default_factory=lambda: [0, 0, 0, 0])
+    magic_bytes: tuple[int, ...] = field(default=(0, 0, 0, 0))
     deposit_amount: int = field(default=100000)
     address: str = field(default="")
     operators_pubkey: str = field(default="")
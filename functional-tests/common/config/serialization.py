@@ -0,0 +1,33 @@
+"""
+Helpers for turning config/params dataclasses into plain dicts.
+"""
+
+from dataclasses import fields, is_dataclass
+from functools import cache
+from typing import Any
+
+# Leaf types returned as-is without probing for dataclass/container types.
+_ATOMIC_TYPES = frozenset({str, int, float, bool, bytes, type(None)})
+
+
+@cache
+def _field_names(cls: type) -> tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
+
+
+def shallow_asdict(obj: Any) -> Any:
+    """Convert a dataclass tree into dicts/lists for serialization.
+
+    Unlike ``dataclasses.asdict`` this does not ``deepcopy`` leaf values:
+    scalars and strings are returned by reference. Only use it on values
+    that are serialized immediately and never mutated.
+    """
+    if type(obj) in _ATOMIC_TYPES:
+        return obj
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {name: shallow_asdict(getattr(obj, name)) for name in _field_names(type(obj))}
+    if isinstance(obj, dict):
+        return {k: shallow_asdict(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [shallow_asdict(v) for v in obj]
+    return obj
@@ -5,13 +5,21 @@ Provides builders for common L2 operations: ETH transfers, contract
 deployments with storage writes, and large-bytecode deployments.
 """
 
+import struct
+
 from eth_account import Account
 
-from common.accounts import ManagedAccount
+from common.accounts import ManagedAccount, cached_local_account
 from common.config.constants import DEV_CHAIN_ID, DEV_PRIVATE_KEY
 
 # Convenience re-export so callers can do ``from common.evm import DEV_ACCOUNT_ADDRESS``.
-DEV_ACCOUNT_ADDRESS = Account.from_key(DEV_PRIVATE_KEY).address
+DEV_ACCOUNT_ADDRESS = cached_local_account(DEV_PRIVATE_KEY).address
+
+# Per-slot init code of ``deploy_storage_filler``: PUSH32 value, PUSH32 key, SSTORE.
+_STORAGE_FILLER_SLOT = struct.Struct(">B32sB32sB")
+
+# Fixed 14-byte CODECOPY/RETURN prelude used by ``deploy_large_runtime_contract``.
+_LARGE_RUNTIME_INIT = struct.Struct(">BHBBBBBBHBBB")
 
 
 def send_eth_transfer(
@@ -25,11 +33,17 @@ def send_eth_transfer(
     return rpc.eth_sendRawTransaction(raw_tx)
 
 
-def sign_deploy(rpc, *, nonce: int, data: bytes, gas: int) -> str:
-    """Sign and broadcast a contract-creation transaction. Returns tx hash."""
+def sign_deploy(rpc, *, nonce: int, data: bytes, gas: int, gas_price: int | None = None) -> str:
+    """Sign and broadcast a contract-creation transaction. Returns tx hash.
+
+    Pass ``gas_price`` when deploying in a loop to skip the ``eth_gasPrice``
+    round-trip per transaction.
+    """
+    if gas_price is None:
+        gas_price = int(rpc.eth_gasPrice(), 16)
     tx = {
         "nonce": nonce,
-        "gasPrice": int(rpc.eth_gasPrice(), 16),
+        "gasPrice": gas_price,
         "gas": gas,
         "to": None,
         "value": 0,
@@ -37,37 +51,40 @@ def sign_deploy(rpc, *, nonce: int, data: bytes, gas: int) -> str:
         "chainId": DEV_CHAIN_ID,
     }
     signed = Account.sign_transaction(tx, DEV_PRIVATE_KEY)
-    return rpc.eth_sendRawTransaction(signed.raw_transaction.hex())
+    return rpc.eth_sendRawTransaction("0x" + signed.raw_transaction.hex())
 
 
-def deploy_storage_filler(rpc, nonce: int, num_slots: int) -> str:
+def deploy_storage_filler(rpc, nonce: int, num_slots: int, gas_price: int | None = None) -> str:
     """Deploy a contract that writes to ``num_slots`` storage slots.
 
     Creates init code: SSTORE(0,1), SSTORE(1,2), ..., SSTORE(n-1,n)
     followed by minimal runtime (RETURN 1 byte).
     """
-    init_code = b""
-    for i in range(num_slots):
-        init_code += bytes([0x7F]) + (i + 1).to_bytes(32, "big")  # PUSH32 value
-        init_code += bytes([0x7F]) + i.to_bytes(32, "big")  # PUSH32 key
-        init_code += bytes([0x55])  # SSTORE
-
     # Minimal runtime (PUSH1 1, PUSH1 0, RETURN)
-    init_code += bytes([0x60, 0x01, 0x60, 0x00, 0xF3])
+    runtime = bytes([0x60, 0x01, 0x60, 0x00, 0xF3])
+
+    slot_size = _STORAGE_FILLER_SLOT.size
+    buf = bytearray(num_slots * slot_size + len(runtime))
+    for i in range(num_slots):
+        _STORAGE_FILLER_SLOT.pack_into(
+            buf, i * slot_size, 0x7F, (i + 1).to_bytes(32, "big"), 0x7F, i.to_bytes(32, "big"), 0x55
+        )
+    buf[num_slots * slot_size :] = runtime
+    init_code = bytes(buf)
 
     gas = 100_000 + num_slots * 25_000
-    return sign_deploy(rpc, nonce=nonce, data=init_code, gas=gas)
+    return sign_deploy(rpc, nonce=nonce, data=init_code, gas=gas, gas_price=gas_price)
 
 
-def deploy_large_runtime_contract(rpc, nonce: int, runtime_size: int = 10_000) -> str:
+def deploy_large_runtime_contract(
+    rpc, nonce: int, runtime_size: int = 10_000, gas_price: int | None = None
+) -> str:
     """Deploy a contract with a large, deterministic runtime bytecode.
 
     Uses CODECOPY to store ``runtime_size`` bytes of 0xFE as the
     contract's runtime code.  Identical ``runtime_size`` values always
     produce the same code hash, which is useful for deduplication tests.
     """
-    runtime_code = bytes([0xFE]) * runtime_size
-
     # Init code layout (14 bytes):
     #   PUSH2 runtime_size   ; 61 XX XX  (3)
     #   PUSH1 14             ; 60 0E     (2)  <- code offset
@@ -76,19 +93,14 @@ def deploy_large_runtime_contract(rpc, nonce: int, runtime_size: int = 10_000) -
     #   PUSH2 runtime_size   ; 61 XX XX  (3)
     #   PUSH1 0              ; 60 00     (2)
     #   RETURN               ; F3        (1)
-    prefix_size = 14
-    init_code = bytearray()
-    init_code += bytes([0x61]) + runtime_size.to_bytes(2, "big")
-    init_code += bytes([0x60, prefix_size])
-    init_code += bytes([0x60, 0x00])
-    init_code += bytes([0x39])
-    init_code += bytes([0x61]) + runtime_size.to_bytes(2, "big")
-    init_code += bytes([0x60, 0x00])
-    init_code += bytes([0xF3])
-
-    assert len(init_code) == prefix_size
-    init_code += runtime_code
+    # fmt: off
+    init_code = _LARGE_RUNTIME_INIT.pack(
+        0x61, runtime_size, 0x60, _LARGE_RUNTIME_INIT.size, 0x60, 0x00, 0x39,
+        0x61, runtime_size, 0x60, 0x00, 0xF3,
+    )
+    # fmt: on
 
     # Gas: intrinsic + calldata + code-deposit + execution headroom
     gas = 100_000 + 216 * runtime_size
-    return sign_deploy(rpc, nonce=nonce, data=bytes(init_code), gas=gas)
+    data = init_code + b"\xfe" * runtime_size
+    return sign_deploy(rpc, nonce=nonce, data=data, gas=gas, gas_price=gas_price)
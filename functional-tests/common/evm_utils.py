@@ -13,6 +13,12 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_RECEIPT_WAIT_BLOCKS = 10
 
+# Receipt polling backs off from 50ms to 400ms. A tx is rarely mined within
+# the first few tens of milliseconds, so starting slower saves RPC calls, and
+# the cap keeps latency under half an EE block once inclusion is due.
+_RECEIPT_POLL_INITIAL_STEP = 0.05
+_RECEIPT_POLL_STEP = 0.4
+
 
 def get_balance(rpc, address: str, block_tag: str = "latest") -> int:
     """Get the balance of an address in wei."""
@@ -40,7 +46,13 @@ def wait_for_receipt(
         except Exception:
             return False
 
-    wait_until(check_receipt, error_with=f"Transaction {tx_hash} not mined", timeout=timeout)
+    wait_until(
+        check_receipt,
+        error_with=f"Transaction {tx_hash} not mined",
+        timeout=timeout,
+        step=_RECEIPT_POLL_STEP,
+        initial_step=_RECEIPT_POLL_INITIAL_STEP,
+    )
     assert receipt is not None
     return receipt
 
@@ -5,9 +5,30 @@ Simple JSON-RPC client.
 import json
 import logging
 from collections.abc import Callable
+from types import MethodType
 from typing import Any
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+
+
+def _encode_json(payload: Any) -> bytes:
+    """
+    Serialize a request payload with orjson.
+
+    Falls back to the stdlib encoder for values orjson rejects, such as
+    integers wider than 64 bits. Responses are still decoded with the stdlib,
+    since orjson turns oversized integers into lossy floats.
+    """
+    try:
+        return orjson.dumps(payload)
+    except TypeError:
+        return json.dumps(payload).encode()
+
+
+# Attribute-style call stubs keyed by RPC method name, see `JsonRpcClient.__getattr__`.
+_METHOD_STUBS: dict[str, Callable[..., Any]] = {}
 
 
 class RpcError(Exception):
@@ -31,6 +52,8 @@ class JsonRpcClient:
     Usage:
         rpc = JsonRpcClient("http://localhost:9944")
         version = rpc.strata_protocolVersion()
+
+    Several calls can be pipelined in one HTTP request with `batch`.
     """
 
     def __init__(
@@ -46,29 +69,51 @@ class JsonRpcClient:
         self.headers = headers or {}
         self.id_counter = 0
         self.logger = logging.getLogger(f"rpc.{self.name}")
-        self.pre_call_hook: Callable[[str], None] = lambda _: None
+        self.pre_call_hook: Callable[[str], None] | None = None
+        # Keep connections alive across calls instead of reconnecting per request.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
     def set_pre_call_hook(self, hook: Callable[[str], None]):
         self.pre_call_hook = hook
 
+    def close(self) -> None:
+        """Close the pooled keep-alive connections held by this client."""
+        self._session.close()
+
     def __getattr__(self, method: str):
         """
         Allow method calls as attributes.
         rpc.strata_protocolVersion() -> calls "strata_protocolVersion" method
+
+        The per-method stub is built once and shared by all clients. It takes
+        the client as an argument instead of closing over it, and is bound on
+        each lookup rather than stored on the instance, so clients never end
+        up in a reference cycle and are freed as soon as they are dropped.
         """
+        # Never turn private/dunder probes (copy, pickle, ...) into RPC methods.
+        if method.startswith("_"):
+            raise AttributeError(method)
 
-        def rpc_call(*params):
-            return self._call(method, params)
+        stub = _METHOD_STUBS.get(method)
+        if stub is None:
 
-        return rpc_call
+            def stub(client: "JsonRpcClient", *params):
+                return client._call(method, params)
 
-    def _call(self, method: str, params: tuple) -> Any:
+            _METHOD_STUBS[method] = stub
+        return MethodType(stub, self)
+
+    def _call(self, method: str, params: tuple, timeout: float | None = None) -> Any:
         """
         Make a JSON-RPC call.
 
         Args:
             method: RPC method name
             params: Method parameters
+            timeout: HTTP timeout for this call, defaults to `self.timeout`
 
         Returns:
             Result from RPC call
@@ -77,7 +122,8 @@ class JsonRpcClient:
             RpcError: If the RPC returns an error
             requests.RequestException: If the HTTP request fails
         """
-        self.pre_call_hook(method)
+        if self.pre_call_hook is not None:
+            self.pre_call_hook(method)
         self.id_counter += 1
 
         payload = {
@@ -87,14 +133,14 @@ class JsonRpcClient:
             "id": self.id_counter,
         }
 
-        self.logger.debug(f"RPC call: {method}({params})")
+        self.logger.debug("RPC call: %s(%s)", method, params)
 
         try:
-            resp = requests.post(
+            resp = self._session.post(
                 self.url,
-                json=payload,
-                headers=self.headers,
-                timeout=self.timeout,
+                data=_encode_json(payload),
+                headers={"Content-Type": "application/json", **self.headers},
+                timeout=self.timeout if timeout is None else timeout,
             )
             resp.raise_for_status()
         except requests.RequestException as e:
@@ -116,12 +162,101 @@ class JsonRpcClient:
         else:
             raise RpcError({"message": "malformed response"})
 
-    def call(self, method: str, *params) -> Any:
+    def batch(self, calls: list[tuple[str, tuple]]) -> list[Any]:
+        """
+        Make several JSON-RPC calls in a single HTTP request (JSON-RPC 2.0 batch).
+
+        Usage:
+            block_number, gas_price = rpc.batch(
+                [("eth_blockNumber", ()), ("eth_gasPrice", ())]
+            )
+
+        Args:
+            calls: (method, params) pairs
+
+        Returns:
+            Results in the same order as `calls`
+
+        Raises:
+            RpcError: If the batch or any call in it returns an error
+            requests.RequestException: If the HTTP request fails
+        """
+        if not calls:
+            return []
+
+        pre_call_hook = self.pre_call_hook
+        payload = []
+        for method, params in calls:
+            if pre_call_hook is not None:
+                pre_call_hook(method)
+            self.id_counter += 1
+            payload.append(
+                {
+                    "jsonrpc": "2.0",
+                    "method": method,
+                    "params": list(params),
+                    "id": self.id_counter,
+                }
+            )
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"RPC batch: {[method for method, _ in calls]}")
+
+        try:
+            resp = self._session.post(
+                self.url,
+                data=_encode_json(payload),
+                headers={"Content-Type": "application/json", **self.headers},
+                timeout=self.timeout,
+            )
+            resp.raise_for_status()
+        except requests.RequestException as e:
+            self.logger.warning(f"RPC batch request failed: {e}")
+            raise
+
+        try:
+            response = resp.json()
+        except json.JSONDecodeError as e:
+            self.logger.warning(f"Invalid JSON response: {resp.text}")
+            raise RpcError({"code": -1, "message": f"Invalid JSON: {e}"}) from e
+
+        # Servers reply with a single error object if they reject the batch as a whole.
+        if isinstance(response, dict):
+            error = response.get("error", {"message": "malformed batch response"})
+            self.logger.warning(f"RPC error: {error}")
+            raise RpcError(error)
+
+        # Batch responses may come back in any order.
+        by_id = {item.get("id"): item for item in response}
+        results = []
+        for request in payload:
+            item = by_id.get(request["id"])
+            if item is None:
+                raise RpcError({"message": f"missing response for id {request['id']}"})
+            if "error" in item:
+                self.logger.warning(f"RPC error: {item['error']}")
+                raise RpcError(item["error"])
+            if "result" not in item:
+                raise RpcError({"message": "malformed response"})
+            results.append(item["result"])
+
+        return results
+
+    def batch_send_raw_transactions(self, raw_txs: list[str]) -> list[str]:
+        """
+        Submit several signed transactions in one HTTP request.
+
+        Returns the transaction hashes in submission order.
+        """
+        return self.batch([("eth_sendRawTransaction", (raw,)) for raw in raw_txs])
+
+    def call(self, method: str, *params, timeout: float | None = None) -> Any:
         """
         Explicit call method (alternative to attribute style).
 
         Usage:
             rpc.call("strata_protocolVersion")
             rpc.call("eth_getBalance", "0x123...", "latest")
+            rpc.call("eth_blockNumber", timeout=2)
         """
-        return self._call(method, params)
+        return self._call(method, params, timeout)
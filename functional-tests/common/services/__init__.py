@@ -3,13 +3,14 @@ Service wrappers for test infrastructure.
 """
 
 from common.services.alpen_client import AlpenClientProps, AlpenClientService
-from common.services.base import RpcService
+from common.services.base import RpcService, wait_for_all_ready
 from common.services.bitcoin import BitcoinProps, BitcoinService
 from common.services.signer import SignerProps, SignerService
 from common.services.strata import StrataProps, StrataService
 
 __all__ = [
     "RpcService",
+    "wait_for_all_ready",
     "AlpenClientService",
     "AlpenClientProps",
     "BitcoinService",
@@ -15,7 +15,7 @@ from common.config.constants import (
 )
 from common.rpc import JsonRpcClient
 from common.services.base import RpcService
-from common.wait import timeout_for_expected_blocks, wait_until
+from common.wait import BACKOFF_INITIAL_STEP, timeout_for_expected_blocks, wait_until
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +65,7 @@ class AlpenClientService(RpcService):
             raise RuntimeError("already running")
 
         self._reset_state()
+        self._drop_cached_rpc()
 
         kwargs = {}
         if self.stdout is not None:
@@ -87,12 +88,15 @@ class AlpenClientService(RpcService):
 
     def _rpc_health_check(self, rpc):
         """Check health by calling eth_blockNumber."""
-        rpc.eth_blockNumber()
+        rpc.call("eth_blockNumber", timeout=self.HEALTH_CHECK_TIMEOUT)
 
     def create_rpc(self) -> JsonRpcClient:
         if not self.check_status():
             raise RuntimeError("Service is not running")
 
+        return self._cached_rpc(self._build_rpc)
+
+    def _build_rpc(self) -> JsonRpcClient:
         rpc = JsonRpcClient(self.props["http_url"])
 
         def _status_check(method: str):
@@ -195,6 +199,7 @@ class AlpenClientService(RpcService):
             error_with=f"Block {block_number} not reached",
             timeout=timeout,
             step=poll_interval,
+            initial_step=BACKOFF_INITIAL_STEP,
         )
         return True
 
@@ -256,6 +261,7 @@ class AlpenClientService(RpcService):
             lambda: self.get_peer_count() >= count,
             error_with=f"Peer count {count} not reached",
             timeout=timeout,
+            initial_step=BACKOFF_INITIAL_STEP,
         )
         return True
 
@@ -272,8 +278,11 @@ class AlpenClientService(RpcService):
             True if block hash matches
         """
 
+        rpc = self.create_rpc()
+        block_tag = hex(block_number)
+
         def check():
-            block = self.get_block_by_number(block_number)
+            block = rpc.eth_getBlockByNumber(block_tag, False)
             if block is None:
                 return False
             return block.get("hash") == expected_hash
@@ -282,6 +291,7 @@ class AlpenClientService(RpcService):
             check,
             error_with=f"Block {block_number} hash mismatch",
             timeout=timeout,
+            initial_step=BACKOFF_INITIAL_STEP,
         )
         return True
 
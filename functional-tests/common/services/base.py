@@ -5,11 +5,13 @@ Avoids ad-hoc monkey-patching and provides type-safe service abstractions.
 """
 
 import logging
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import flexitest
 
-from common.wait import wait_until
+from common.wait import BACKOFF_INITIAL_STEP, wait_until
 
 
 class RpcService(flexitest.service.ProcService):
@@ -51,6 +53,10 @@ class RpcService(flexitest.service.ProcService):
         svc.stop()
     """
 
+    # HTTP timeout for `_rpc_health_check` calls, so one stalled probe does not
+    # eat the whole `wait_for_ready` budget.
+    HEALTH_CHECK_TIMEOUT: float = 5.0
+
     def __init__(
         self,
         props: dict[str, Any],
@@ -70,6 +76,30 @@ class RpcService(flexitest.service.ProcService):
         super().__init__(props, cmd, stdout)
         self._name = name or cmd[0]
         self._logger = logging.getLogger(f"service.{self._name}")
+        # RPC client memoized by subclasses' create_rpc(), see `_cached_rpc`.
+        self._rpc: Any = None
+
+    def stop(self):
+        super().stop()
+        self._drop_cached_rpc()
+
+    def _cached_rpc(self, build: Callable[[], Any]) -> Any:
+        """
+        Return the memoized RPC client, building it with `build` on first use.
+
+        Reusing one client keeps its HTTP connections alive across calls. The
+        cached client is dropped (and closed, if it has a `close` method) when
+        the service is stopped or restarted.
+        """
+        if self._rpc is None:
+            self._rpc = build()
+        return self._rpc
+
+    def _drop_cached_rpc(self) -> None:
+        rpc, self._rpc = self._rpc, None
+        close = getattr(rpc, "close", None)
+        if close is not None:
+            close()
 
     def create_rpc(self):
         """
@@ -139,6 +169,7 @@ class RpcService(flexitest.service.ProcService):
             error_with=f"Service '{self._name}' not ready",
             timeout=timeout,
             step=interval,
+            initial_step=BACKOFF_INITIAL_STEP,
         )
 
     def wait_for_down(self, timeout: int = 30, interval: float = 0.5) -> None:
@@ -158,3 +189,32 @@ class RpcService(flexitest.service.ProcService):
             timeout=timeout,
             step=interval,
         )
+
+
+def wait_for_all_ready(services: Sequence[tuple[Any, int]]) -> None:
+    """
+    Wait for several independently started services to become ready.
+
+    Each service's `wait_for_ready` runs on its own thread, so total wait time
+    is that of the slowest service rather than the sum over all of them. Only
+    pass services whose readiness does not depend on one another.
+
+    Usage:
+        wait_for_all_ready([(signer, 10), (fullnode, 20)])
+
+    Args:
+        services: (service, timeout) pairs, where each service exposes
+            `wait_for_ready(timeout=...)` and timeout is in seconds
+
+    Raises:
+        AssertionError: If any service doesn't become ready within its timeout
+    """
+    if len(services) <= 1:
+        for svc, timeout in services:
+            svc.wait_for_ready(timeout=timeout)
+        return
+
+    with ThreadPoolExecutor(max_workers=len(services)) as pool:
+        futures = [pool.submit(svc.wait_for_ready, timeout=timeout) for svc, timeout in services]
+        for fut in futures:
+            fut.result()
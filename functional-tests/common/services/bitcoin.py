@@ -58,7 +58,9 @@ class BitcoinService(RpcService):
         if not self.check_status():
             raise RuntimeError("Service is not running")
 
-        return BitcoindClient(base_url=self.props["rpc_url"], network="regtest")
+        return self._cached_rpc(
+            lambda: BitcoindClient(base_url=self.props["rpc_url"], network="regtest")
+        )
 
     def mine_until(
         self,
@@ -11,7 +11,7 @@ from typing import Any, TypedDict
 from common.rpc import JsonRpcClient
 from common.rpc_types.strata import *
 from common.services.base import RpcService
-from common.wait import wait_until, wait_until_with_value
+from common.wait import BACKOFF_INITIAL_STEP, wait_until, wait_until_with_value
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +26,12 @@ def _register_kill(proc):
     atexit.register(kill)
 
 
+def _tip_slot(status: dict) -> int:
+    """Tip slot of a chain status, or 0 if the node has no tip yet."""
+    tip = status.get("tip")
+    return tip["slot"] if tip else 0
+
+
 class StrataProps(TypedDict):
     """Properties for Strata service."""
 
@@ -80,6 +86,7 @@ class StrataService(RpcService):
             raise RuntimeError("already running")
 
         self._reset_state()
+        self._drop_cached_rpc()
 
         kwargs = {}
         if self.stdout is not None:
@@ -101,23 +108,26 @@ class StrataService(RpcService):
 
     def _rpc_health_check(self, rpc):
         """Check Strata health by calling strata_protocolVersion."""
-        rpc.strata_protocolVersion()
+        rpc.call("strata_protocolVersion", timeout=self.HEALTH_CHECK_TIMEOUT)
 
     def create_rpc(self) -> JsonRpcClient:
         if not self.check_status():
             raise RuntimeError("Service is not running")
 
-        rpc = JsonRpcClient(self.props["rpc_url"])
-
-        def _status_check(method: str):
-            if not self.check_status():
-                self._logger.warning(f"service '{self._name}' crashed before call to {method}")
-                raise RuntimeError(f"process '{self._name}' crashed")
+        return self._cached_rpc(self._build_rpc)
 
-        rpc.set_pre_call_hook(_status_check)
+    def _build_rpc(self) -> JsonRpcClient:
+        rpc = JsonRpcClient(self.props["rpc_url"])
 
+        rpc.set_pre_call_hook(self._status_check)
         return rpc
 
+    def _status_check(self, method: str) -> None:
+        """Pre-call hook shared by all of this service's RPC clients."""
+        if not self.check_status():
+            self._logger.warning(f"service '{self._name}' crashed before call to {method}")
+            raise RuntimeError(f"process '{self._name}' crashed")
+
     def create_admin_rpc(self) -> JsonRpcClient:
         if not self.check_status():
             raise RuntimeError("Service is not running")
@@ -127,12 +137,7 @@ class StrataService(RpcService):
             headers={"Authorization": f"Bearer {self.props['admin_rpc_token']}"},
         )
 
-        def _status_check(method: str):
-            if not self.check_status():
-                self._logger.warning(f"service '{self._name}' crashed before call to {method}")
-                raise RuntimeError(f"process '{self._name}' crashed")
-
-        rpc.set_pre_call_hook(_status_check)
+        rpc.set_pre_call_hook(self._status_check)
         return rpc
 
     def create_submit_rpc(self) -> JsonRpcClient:
@@ -144,12 +149,7 @@ class StrataService(RpcService):
             headers={"Authorization": f"Bearer {self.props['submit_rpc_token']}"},
         )
 
-        def _status_check(method: str):
-            if not self.check_status():
-                self._logger.warning(f"service '{self._name}' crashed before call to {method}")
-                raise RuntimeError(f"process '{self._name}' crashed")
-
-        rpc.set_pre_call_hook(_status_check)
+        rpc.set_pre_call_hook(self._status_check)
         return rpc
 
     def wait_for_rpc_ready(
@@ -173,7 +173,12 @@ class StrataService(RpcService):
         err = f"RPC not ready (method: {method})"
         rpc = self.create_rpc()
 
-        wait_until(lambda: rpc.call(method) is not None, error_with=err, timeout=timeout)
+        wait_until(
+            lambda: rpc.call(method) is not None,
+            error_with=err,
+            timeout=timeout,
+            initial_step=BACKOFF_INITIAL_STEP,
+        )
         return rpc
 
     def wait_for_account_genesis_epoch_commitment(
@@ -204,6 +209,7 @@ class StrataService(RpcService):
             error_with=f"Timed out waiting for account {account_id} genesis commitment",
             timeout=timeout,
             step=poll_interval,
+            initial_step=BACKOFF_INITIAL_STEP,
         )
 
     def get_sync_status(self, rpc: JsonRpcClient | None = None) -> ChainSyncStatus:
@@ -223,6 +229,7 @@ class StrataService(RpcService):
             rpc.strata_getChainStatus,
             lambda x: x is not None,
             error_with="Timed out getting chain status",
+            initial_step=BACKOFF_INITIAL_STEP,
         )
         return status
 
@@ -266,7 +273,7 @@ class StrataService(RpcService):
         rpc: JsonRpcClient | None = None,
         timeout: int = 10,
         poll_interval: float = 1.0,
-    ) -> None:
+    ) -> int:
         """
         Wait for the chain to reach a specific block height.
 
@@ -275,17 +282,22 @@ class StrataService(RpcService):
             rpc: Optional RPC client. If None, creates a new one.
             timeout: Maximum time to wait in seconds
             poll_interval: How often to check the height
+
+        Returns:
+            Block height observed by the poll that satisfied the wait.
         """
         if rpc is None:
             rpc = self.create_rpc()
 
-        wait_until_with_value(
+        status = wait_until_with_value(
             lambda: rpc.strata_getChainStatus(),
-            lambda status: status.get("tip", {}).get("slot", 0) >= target_height,
+            lambda status: _tip_slot(status) >= target_height,
             error_with=f"Timeout waiting for block height {target_height}",
             timeout=timeout,
             step=poll_interval,
+            initial_step=BACKOFF_INITIAL_STEP,
         )
+        return _tip_slot(status)
 
     def wait_for_additional_blocks(
         self,
@@ -323,13 +335,12 @@ class StrataService(RpcService):
             target_height,
         )
 
-        self.wait_for_block_height(
+        return self.wait_for_block_height(
             target_height,
             rpc,
             timeout=total_timeout,
             poll_interval=poll_interval,
         )
-        return self.get_cur_block_height(rpc)
 
     def wait_for_asm_manifest_commitment_at(
         self,
@@ -366,12 +377,15 @@ class StrataService(RpcService):
             error_with=f"No ASM manifest commitment at L1 height {height}",
             timeout=timeout,
             step=poll_interval,
+            initial_step=BACKOFF_INITIAL_STEP,
         )
 
     def check_block_generation_in_range(self, rpc: JsonRpcClient, start: int, end: int) -> int:
         """Checks for range of blocks produced and returns current block height"""
+        if end < start:
+            raise ValueError("end must be >= start")
+
         logger.info(f"Waiting for blocks from {start} to {end} be produced...")
-        for target_height in range(start, end + 1):
-            logger.info(f"Waiting for block {target_height}...")
-            self.wait_for_block_height(target_height, rpc)
-        return self.get_cur_block_height(rpc)
+        # Heights are monotonic, so waiting for `end` covers every block in the
+        # range. Keep the old budget of 10s per block.
+        return self.wait_for_block_height(end, rpc, timeout=(end - start + 1) * 10)
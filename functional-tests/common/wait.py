@@ -5,7 +5,7 @@ Waiting utilities for test synchronization.
 import logging
 import math
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from typing import Any, TypeVar
 
 from common.config.constants import (
@@ -38,17 +38,50 @@ def timeout_for_expected_blocks(
     return math.ceil(expected_blocks * seconds_per_block + slack_seconds)
 
 
+# Growth factor for backoff polling, see `_poll_delays`.
+_BACKOFF_FACTOR = 1.5
+
+# Suggested `initial_step` for side-effect free waits such as readiness probes.
+BACKOFF_INITIAL_STEP = 0.01
+
+
+def _poll_delays(step: float, initial_step: float | None) -> Iterator[float]:
+    """
+    Yield sleep durations between polls.
+
+    Without `initial_step` every delay is `step`. With it, delays start at
+    `initial_step` and grow geometrically until capped at `step`, so conditions
+    that become true shortly after the wait starts are noticed quickly without
+    polling faster than `step` over long waits.
+    """
+    if initial_step is None:
+        while True:
+            yield step
+
+    delay = min(initial_step, step)
+    while True:
+        yield delay
+        delay = min(delay * _BACKOFF_FACTOR, step)
+
+
 def wait_until(
     fn: Callable[[], Any],
     error_with: str = "Timed out",
     timeout: int = 30,
     step: float = 0.5,
+    initial_step: float | None = None,
 ):
     """
     Wait until a function call returns truth value, given time step, and timeout.
     This function waits until function call returns truth value at the interval of step seconds.
+
+    If `initial_step` is given, polling starts at that interval and backs off
+    to `step`. Only use it for side-effect-free checks; do not use it when `fn`
+    mines blocks or sends transactions, since it is called more often early in
+    the wait.
     """
     deadline = time.monotonic() + timeout
+    delays = _poll_delays(step, initial_step)
 
     while True:
         try:
@@ -61,7 +94,7 @@ def wait_until(
         if remaining <= 0:
             break
 
-        time.sleep(min(step, remaining))
+        time.sleep(min(next(delays), remaining))
 
     try:
         if fn():
@@ -82,12 +115,19 @@ def wait_until_with_value(
     timeout: int = 5,
     step: float = 0.5,
     debug=False,
+    initial_step: float | None = None,
 ) -> T:
     """
     Similar to `wait_until` but this returns the value of the function.
     This also takes another predicate which acts on the function value and returns a bool
+
+    If `initial_step` is given, polling starts at that interval and backs off
+    to `step`. Only use it for side-effect-free checks; do not use it when `fn`
+    mines blocks or sends transactions, since it is called more often early in
+    the wait.
     """
     deadline = time.monotonic() + timeout
+    delays = _poll_delays(step, initial_step)
 
     while True:
         try:
@@ -103,7 +143,7 @@ def wait_until_with_value(
         if remaining <= 0:
             break
 
-        time.sleep(min(step, remaining))
+        time.sleep(min(next(delays), remaining))
 
     try:
         r = fn()
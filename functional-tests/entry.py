@@ -20,22 +20,11 @@ import sys
 import flexitest
 from flexitest.runtime import load_module_at, scan_dir_for_modules
 
-# Import environments
 from common.config import EpochSealingConfig, ServiceType
 from common.config.params import GenesisAccountData
 from common.keepalive import KEEP_ALIVE_TEST_NAME, load_keepalive_test
 from common.runtime import TestRuntimeWithLogging
 from common.test_logging import TestNameFilter
-from envconfigs.alpen_client import AlpenClientEnv
-from envconfigs.el_ol import EeOLEnv
-from envconfigs.el_ol_checkpoint_sync import EeOLCheckpointSyncEnv
-from envconfigs.strata import StrataEnvConfig
-
-# Import factories
-from factories.alpen_client import AlpenClientFactory
-from factories.bitcoin import BitcoinFactory
-from factories.signer import SignerFactory
-from factories.strata import StrataFactory
 
 
 def disabled_tests() -> frozenset[str]:
@@ -136,6 +125,18 @@ def normalize_test_names(raw_tests: list[str]) -> frozenset[str]:
     return frozenset(names)
 
 
+def groups_of_test(test_path: str, test_dir: str) -> tuple[str, ...] | None:
+    """
+    Groups of a test, i.e. the directories between `test_dir` and the file.
+
+    Returns None if `test_path` is not under `test_dir`.
+    """
+    rel_parts = os.path.relpath(test_path, test_dir).split(os.sep)
+    if rel_parts[0] == os.pardir:
+        return None
+    return tuple(rel_parts[:-1])
+
+
 def filter_tests(
     args: argparse.Namespace, modules: dict[str, str], test_dir: str
 ) -> dict[str, str]:
@@ -155,23 +156,15 @@ def filter_tests(
     arg_tests = normalize_test_names((args.tests or []) + (args.tests_pos or []))
     disabled = disabled_tests()
 
+    if not arg_groups:
+        # Common case: no directory lookups needed, only set membership.
+        selected = modules.keys() - disabled
+        if arg_tests:
+            selected &= arg_tests
+        return {name: path for name, path in modules.items() if name in selected}
+
     filtered = {}
     for test_name, test_path in modules.items():
-        # Extract directory structure for grouping
-        test_path_parts = os.path.normpath(test_path).split(os.sep)
-
-        # Find the index of the test directory in the path
-        try:
-            test_dir_idx = next(
-                i for i, part in enumerate(test_path_parts) if part == os.path.basename(test_dir)
-            )
-        except StopIteration:
-            # If test_dir not in path, skip this test
-            continue
-
-        # Everything between test_dir and the file is a group
-        test_groups = frozenset(test_path_parts[test_dir_idx + 1 : -1])
-
         # Filtering logic:
         # 1. Skip disabled tests
         if test_name in disabled:
@@ -181,8 +174,9 @@ def filter_tests(
         if arg_tests and test_name not in arg_tests:
             continue
 
-        # 3. If groups requested, only include tests in those groups
-        if arg_groups and not (arg_groups & test_groups):
+        # 3. Only include tests in the requested groups
+        groups = groups_of_test(test_path, test_dir)
+        if groups is None or arg_groups.isdisjoint(groups):
             continue
 
         filtered[test_name] = test_path
@@ -221,17 +215,10 @@ def list_tests(modules: dict[str, str], test_dir: str) -> None:
     ungrouped_tests: list[str] = []
 
     for test_name, test_path in sorted(modules.items()):
-        test_path_parts = os.path.normpath(test_path).split(os.sep)
-
-        try:
-            test_dir_idx = next(
-                i for i, part in enumerate(test_path_parts) if part == os.path.basename(test_dir)
-            )
-        except StopIteration:
+        groups = groups_of_test(test_path, test_dir)
+        if groups is None:
             continue
 
-        groups = test_path_parts[test_dir_idx + 1 : -1]
-
         if groups:
             group_key = "/".join(groups)
             if group_key not in grouped_tests:
@@ -277,6 +264,17 @@ def main(argv: list[str]) -> int:
         list_tests(modules, test_dir)
         return 0
 
+    # Environments and factories are only needed to run tests; importing them
+    # here keeps `--help` and argument errors from loading their whole chain.
+    from envconfigs.alpen_client import AlpenClientEnv
+    from envconfigs.el_ol import EeOLEnv
+    from envconfigs.el_ol_checkpoint_sync import EeOLCheckpointSyncEnv
+    from envconfigs.strata import StrataEnvConfig
+    from factories.alpen_client import AlpenClientFactory
+    from factories.bitcoin import BitcoinFactory
+    from factories.signer import SignerFactory
+    from factories.strata import StrataFactory
+
     # Create factories
     factories: dict[ServiceType, flexitest.Factory] = {
         ServiceType.AlpenClient: AlpenClientFactory(range(30303, 30503)),
@@ -9,6 +9,7 @@ from typing import cast
 import flexitest
 
 from common.config import EeDaConfig, ServiceType
+from common.services.base import wait_for_all_ready
 from common.services.bitcoin import BitcoinService
 from factories.alpen_client import AlpenClientFactory, generate_sequencer_keypair
 from factories.bitcoin import BitcoinFactory
@@ -195,11 +196,11 @@ class AlpenClientEnv(flexitest.EnvConfig):
                 ol_endpoint=fullnode_ol_endpoint or ol_endpoint,
                 ee_params_path=ee_params_path,
             )
-            fullnode.wait_for_ready(timeout=60)
             fullnodes.append(fullnode)
 
-            # Track enode for mesh bootnodes
+            # Mesh bootnodes need each fullnode up before the next one starts
             if envparams.mesh_bootnodes:
+                fullnode.wait_for_ready(timeout=60)
                 fn_enodes.append(fullnode.get_enode())
 
             # Use "fullnode" for single, "fullnode_N" for multiple
@@ -210,10 +211,12 @@ class AlpenClientEnv(flexitest.EnvConfig):
             )
             services[key] = fullnode
 
+        # Otherwise fullnodes only depend on the sequencer, so wait for them together
+        if not envparams.mesh_bootnodes:
+            wait_for_all_ready([(fn, 60) for fn in fullnodes])
+
         # Connect fullnodes to sequencer via admin_addPeer (unless pure_discovery mode)
         if not envparams.pure_discovery:
             seq_rpc = sequencer.create_rpc()
-            for fn in fullnodes:
-                fn_enode = fn.get_enode()
-                seq_rpc.admin_addPeer(fn_enode)
+            seq_rpc.batch([("admin_addPeer", (fn.get_enode(),)) for fn in fullnodes])
         return services
@@ -6,6 +6,7 @@ import flexitest
 
 from common.config import BitcoindConfig, EpochSealingConfig, ServiceType
 from common.config.params import L1BlockCommitment
+from common.services.base import wait_for_all_ready
 from factories.bitcoin import BitcoinFactory
 from factories.signer import SignerFactory
 from factories.strata import StrataFactory
@@ -73,7 +74,6 @@ class StrataSequencerFullnodeEnvConfig(flexitest.EnvConfig):
             sequencer.props["admin_rpc_port"],
             sequencer.props["admin_rpc_token"],
         )
-        signer.wait_for_ready(timeout=10)
 
         fullnode_result = strata_factory.create_node(
             bitcoind_config,
@@ -81,7 +81,9 @@ class StrataSequencerFullnodeEnvConfig(flexitest.EnvConfig):
             is_sequencer=False,
         )
         fullnode = fullnode_result.service
-        fullnode.wait_for_ready(timeout=20)
+
+        # The signer and fullnode only depend on services already up.
+        wait_for_all_ready([(signer, 10), (fullnode, 20)])
 
         return {
             ServiceType.Bitcoin: bitcoind,
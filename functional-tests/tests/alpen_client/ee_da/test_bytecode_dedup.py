@@ -52,8 +52,11 @@ class TestDaBytecodeDeduplicationTest(BaseTest):
 
         nonce = int(eth_rpc.eth_getTransactionCount(DEV_ACCOUNT_ADDRESS, "latest"), 16)
         phase_a_deploy_block = sequencer.get_block_number()
+        gas_price = int(eth_rpc.eth_gasPrice(), 16)
         for i in range(3):
-            tx_hash = deploy_large_runtime_contract(eth_rpc, nonce + i, dedup_runtime_size)
+            tx_hash = deploy_large_runtime_contract(
+                eth_rpc, nonce + i, dedup_runtime_size, gas_price
+            )
             logger.info(f"  Phase A contract {i + 1}/3: {tx_hash[:20]}...")
 
         trigger_batch_sealing(sequencer, btc_rpc)
@@ -112,8 +115,11 @@ class TestDaBytecodeDeduplicationTest(BaseTest):
 
         nonce = int(eth_rpc.eth_getTransactionCount(DEV_ACCOUNT_ADDRESS, "latest"), 16)
         phase_b_deploy_block = sequencer.get_block_number()
+        gas_price = int(eth_rpc.eth_gasPrice(), 16)
         for i in range(3):
-            tx_hash = deploy_large_runtime_contract(eth_rpc, nonce + i, dedup_runtime_size)
+            tx_hash = deploy_large_runtime_contract(
+                eth_rpc, nonce + i, dedup_runtime_size, gas_price
+            )
             logger.info(f"  Phase B contract {i + 1}/3: {tx_hash[:20]}...")
 
         trigger_batch_sealing(sequencer, btc_rpc)
@@ -81,9 +81,10 @@ class TestDaMultiChunkTest(BaseTest):
 
         # Submit ALL transactions without waiting for individual confirmations
         logger.info("Submitting all contract deployments to mempool...")
+        gas_price = int(eth_rpc.eth_gasPrice(), 16)
         tx_hashes = []
         for i in range(num_contracts):
-            tx_hash = deploy_storage_filler(eth_rpc, nonce + i, slots_per_contract)
+            tx_hash = deploy_storage_filler(eth_rpc, nonce + i, slots_per_contract, gas_price)
             tx_hashes.append(tx_hash)
         logger.info(f"  Submitted {len(tx_hashes)} transactions to mempool")
 
@@ -4,9 +4,9 @@ import logging
 
 import flexitest
 
+from common.accounts import get_dev_account
 from common.base_test import BaseTest
 from common.config.constants import ServiceType
-from common.evm import DEV_ACCOUNT_ADDRESS, send_eth_transfer
 from common.services import AlpenClientService, BitcoinService
 from common.wait import timeout_for_expected_blocks, wait_until, wait_until_with_value
 from envconfigs.alpen_client import AlpenClientEnv
@@ -40,11 +40,17 @@ class TestDaPublicationParityReconstruction(BaseTest):
         eth_rpc = sequencer.create_rpc()
         baseline_l1_height = btc_rpc.proxy.getblockcount()
 
-        nonce = int(eth_rpc.eth_getTransactionCount(DEV_ACCOUNT_ADDRESS, "latest"), 16)
+        dev_account = get_dev_account(eth_rpc)
         recipient = "0x70997970C51812dc3A010C7d01b50e0d17dc79C8"
 
         logger.info("Sending ETH transfers for DA publication parity test...")
-        tx_hashes = [send_eth_transfer(eth_rpc, nonce + i, recipient, 10**18) for i in range(6)]
+        raw_txs = dev_account.sign_transfer_batch(
+            to=recipient,
+            value=10**18,
+            gas_price=int(eth_rpc.eth_gasPrice(), 16),
+            count=6,
+        )
+        tx_hashes = eth_rpc.batch_send_raw_transactions(raw_txs)
 
         trigger_batch_sealing(sequencer, btc_rpc, num_blocks=10)
 
@@ -44,13 +44,13 @@ from pathlib import Path
 
 import flexitest
 
+from common.accounts import ManagedAccount
 from common.base_test import BaseTest
-from common.config.constants import ServiceType
+from common.config.constants import DEV_PRIVATE_KEY, ServiceType
 from common.evm import (
     DEV_ACCOUNT_ADDRESS,
     deploy_large_runtime_contract,
     deploy_storage_filler,
-    send_eth_transfer,
 )
 from common.evm_utils import wait_for_receipt
 from common.services.alpen_client import AlpenClientService
@@ -180,16 +180,24 @@ class TestEeProverPipelineAlive(BaseTest):
 
         recipient_balance_before = int(rpc.eth_getBalance(TRANSFER_RECIPIENT, "latest"), 16)
 
-        # (a) Plain ETH transfers.
+        # All txs go out in one burst, so one gas price quote covers them.
+        gas_price = int(rpc.eth_gasPrice(), 16)
+
+        # (a) Plain ETH transfers. Only nonce and value vary, so bind the rest once.
+        sign_transfer = ManagedAccount.from_key(DEV_PRIVATE_KEY).make_transfer_signer(
+            to=TRANSFER_RECIPIENT, gas_price=gas_price
+        )
         for _ in range(TRANSFER_COUNT):
-            send_eth_transfer(rpc, nonce, TRANSFER_RECIPIENT, TRANSFER_AMOUNT_WEI)
+            rpc.eth_sendRawTransaction(sign_transfer(nonce, TRANSFER_AMOUNT_WEI))
             nonce += 1
 
         # (b) Storage-filler deploys. Each SSTOREs to N distinct slots,
         # producing varied multiproof targets per chunk.
         storage_tx_hashes = []
         for _ in range(STORAGE_CONTRACT_COUNT):
-            storage_tx_hashes.append(deploy_storage_filler(rpc, nonce, SLOTS_PER_STORAGE_CONTRACT))
+            storage_tx_hashes.append(
+                deploy_storage_filler(rpc, nonce, SLOTS_PER_STORAGE_CONTRACT, gas_price)
+            )
             nonce += 1
 
         # (c) Large-runtime deploys, all identical size so they share a
@@ -198,7 +206,9 @@ class TestEeProverPipelineAlive(BaseTest):
         large_tx_hashes = []
         for _ in range(LARGE_CONTRACT_COUNT):
             large_tx_hashes.append(
-                deploy_large_runtime_contract(rpc, nonce, runtime_size=LARGE_RUNTIME_SIZE)
+                deploy_large_runtime_contract(
+                    rpc, nonce, runtime_size=LARGE_RUNTIME_SIZE, gas_price=gas_price
+                )
             )
             nonce += 1
 
@@ -60,12 +60,13 @@ class TestNonceHandling(AlpenClientTest):
             )
 
         tx_hashes = []
-        for i in range(3):
+        for i, nonce in enumerate(account.reserve_nonces(3)):
             raw_tx = account.sign_transfer(
                 to=recipient,
                 value=1000,
                 gas_price=gas_price,
                 gas=21000,
+                nonce=nonce,
             )
             tx_hash = rpc.eth_sendRawTransaction(raw_tx)
             tx_hashes.append(tx_hash)